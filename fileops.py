@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the video organizer and the dataset scripts
+"""
+
+import errno
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (linux/fs.h): copy-on-write clone of a whole file
+FICLONE = 0x40049409
+
+
+def clone_file(src: str, dst: str):
+    """Create dst as a reflink (copy-on-write clone) of src, e.g. on Btrfs or XFS"""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform")
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def fast_move(src: str, dst: str):
+    """Move a file using the cheapest mechanism available"""
+    # Same filesystem: a single rename, no data is touched
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Different mount points can still share storage (e.g. Btrfs subvolumes):
+    # try an instant clone, otherwise copy (sendfile() on Linux, stays in-kernel)
+    try:
+        clone_file(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+    os.unlink(src)
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 import os
-import shutil
+import sys
+
+from fileops import fast_move
+
+# Per-file messages only when run interactively: each print is a blocking
+# write, which adds up on slow terminals and SSH sessions
+VERBOSE = sys.stdout.isatty()
 
 # Read the list of images
 with open('/tmp/image_list.txt', 'r') as f:
@@ -12,26 +18,38 @@ print(f"Found {len(images)} images to process")
 base_dir = '/home/user/aishahLora'
 os.chdir(base_dir)
 
-# Rename images sequentially
-for idx, old_path in enumerate(images, start=1):
-    # Get the extension
-    _, ext = os.path.splitext(old_path)
-
-    # New filename
-    new_name = f"{idx}{ext}"
-    new_path = os.path.join(base_dir, new_name)
-
-    # Rename the image
-    if os.path.exists(old_path):
-        shutil.move(old_path, new_path)
-        print(f"Renamed: {os.path.basename(old_path)} -> {new_name}")
-
-        # Create associated text file
+# Rename images sequentially, collecting messages to print in a single write
+log_lines = []
+# The old -> new mapping is printed even if a move fails halfway: the renames can't be undone
+try:
+    for idx, old_path in enumerate(images, start=1):
+        # Get the extension
+        _, ext = os.path.splitext(old_path)
+
+        # New filename
+        new_name = f"{idx}{ext}"
+        new_path = os.path.join(base_dir, new_name)
+
+        # Rename the image
+        try:
+            fast_move(old_path, new_path)
+        except FileNotFoundError:
+            log_lines.append(f"Warning: {old_path} not found")
+            continue
+        if VERBOSE:
+            log_lines.append(f"Renamed: {os.path.basename(old_path)} -> {new_name}")
+
+        # Create associated empty text file, keeping any caption already written
         txt_file = os.path.join(base_dir, f"{idx}.txt")
-        with open(txt_file, 'w') as f:
-            f.write("")  # Create empty file for now
-        print(f"Created: {idx}.txt")
-    else:
-        print(f"Warning: {old_path} not found")
+        try:
+            os.close(os.open(txt_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            if VERBOSE:
+                log_lines.append(f"Created: {idx}.txt")
+        except FileExistsError:
+            if VERBOSE:
+                log_lines.append(f"Kept existing: {idx}.txt")
+finally:
+    if log_lines:
+        print("\n".join(log_lines))
 
 print("\nRenaming and text file creation completed!")
@@ -6,8 +6,10 @@ Video Organizer - Organize AI-generated videos with tags
 import sys
 import os
 import json
-import shutil
+import hashlib
+import sqlite3
 import subprocess
+import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Set
@@ -18,11 +20,142 @@ from PyQt6.QtWidgets import (
     QDialog, QLineEdit, QListWidget, QMessageBox, QFrame, QCheckBox,
     QSizePolicy, QProgressBar
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QObject, QThreadPool, QRunnable, pyqtSlot
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import Qt, QSize, QThread, QTimer, pyqtSignal, QObject, QThreadPool, QRunnable, pyqtSlot
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage
 from queue import Queue
 import threading
 
+from fileops import fast_move
+
+# Optional: decode thumbnails in-process with PyAV instead of spawning ffmpeg
+try:
+    import av
+    from PIL import Image
+except ImportError:
+    av = None
+
+
+def detect_hwaccel_args() -> List[str]:
+    """Return ffmpeg input args for the first usable GPU decoder (NVDEC, then VAAPI)"""
+    # (ffmpeg decode args, matching -init_hw_device spec: type[=name][:device])
+    candidates = [
+        (['-hwaccel', 'cuda'], 'cuda'),
+        (['-hwaccel', 'vaapi', '-hwaccel_device', '/dev/dri/renderD128'], 'vaapi:/dev/dri/renderD128'),
+    ]
+
+    for args, device in candidates:
+        # Only listing the method isn't enough: check a device can actually be opened
+        cmd = [
+            'ffmpeg', '-hide_banner', '-v', 'error',
+            '-init_hw_device', device,
+            '-f', 'lavfi', '-i', 'nullsrc',
+            '-frames:v', '1', '-f', 'null', '-'
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=10)
+        except FileNotFoundError:
+            return []  # No ffmpeg at all
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            print(f"✓ Hardware decoding enabled: {args[1]}")
+            return args
+
+    return []
+
+
+_hwaccel_lock = threading.Lock()
+_hwaccel_args = None
+
+
+def get_hwaccel_args() -> List[str]:
+    """Probe GPU decoding the first time ffmpeg is actually needed, then reuse the result"""
+    global _hwaccel_args
+    # Workers call this concurrently: the lock makes sure the probe only runs once
+    with _hwaccel_lock:
+        if _hwaccel_args is None:
+            _hwaccel_args = detect_hwaccel_args()
+        return _hwaccel_args
+
+
+def thumbnail_key(video_path: str, st: os.stat_result) -> str:
+    """Stable thumbnail key for a video, changing when the file is replaced or re-encoded"""
+    # st_dev/st_ino are deliberately left out: device numbers change across
+    # remounts (USB drives, NFS/FUSE, Btrfs subvolumes)
+    identity = f"{video_path}:{st.st_size}:{int(st.st_mtime)}"
+    return hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+
+
+def thumbnail_exists(thumbnail_path: str) -> bool:
+    """True if a complete thumbnail is present (empty files are failed leftovers)"""
+    try:
+        return os.path.getsize(thumbnail_path) > 0
+    except OSError:
+        return False
+
+
+def scan_videos(folder: str, extensions: Set[str]):
+    """Recursively yield (path, mtime) for video files under folder"""
+    try:
+        entries = os.scandir(folder)
+    except OSError as e:
+        print(f"Error reading {folder}: {e}")
+        return
+
+    # DirEntry type checks and stat() reuse what readdir already returned where possible
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_videos(entry.path, extensions)
+            elif entry.is_file():
+                if os.path.splitext(entry.name)[1].lower() in extensions:
+                    yield entry.path, entry.stat().st_mtime
+
+
+class ThumbnailCache:
+    """Persistent video -> thumbnail index, kept out of the main config file
+
+    Duplicate paths of one file share a single thumbnail named after whichever
+    path generated it, so the thumbnail isn't always derivable from the key.
+    """
+
+    def __init__(self, db_path: str = "~/.cache/video_organizer/cache_index.db"):
+        self.db_path = os.path.expanduser(db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # WAL makes each single-row write cheap instead of rewriting the whole index
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Entries from before fingerprints were stored can't be validated: start over
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(thumbs)")]
+        if columns and "key" not in columns:
+            self.conn.execute("DROP TABLE thumbs")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS thumbs "
+            "(video TEXT PRIMARY KEY, key TEXT NOT NULL, thumb TEXT NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get(self, video_path: str, key: str):
+        """Return the cached thumbnail path for a video with this fingerprint, or None"""
+        row = self.conn.execute(
+            "SELECT thumb FROM thumbs WHERE video = ? AND key = ?", (video_path, key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, video_path: str, key: str, thumbnail_path: str):
+        """Store the thumbnail path for a video and its fingerprint"""
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO thumbs (video, key, thumb) VALUES (?, ?, ?)",
+                    (video_path, key, thumbnail_path)
+                )
+        except sqlite3.Error as e:
+            print(f"Error saving thumbnail cache: {e}")
+
 
 class Config:
     """Manage application configuration"""
@@ -30,6 +163,18 @@ class Config:
     def __init__(self, config_path: str = "video_organizer_config.json"):
         self.config_path = config_path
         self.data = self.load()
+        self._sorted_tags_cache = None
+        self.thumbnail_cache = ThumbnailCache()
+
+        # Coalesce bursts of changes (e.g. validating many videos) into one write
+        self._save_timer = QTimer(singleShot=True, interval=2000)
+        self._save_timer.timeout.connect(self.flush)
+
+        # Older configs stored the thumbnail cache inline, keyed by path only:
+        # those entries can't be checked against a fingerprint, so drop them
+        if "thumbnail_cache" in self.data:
+            del self.data["thumbnail_cache"]
+            self.save()
 
     def load(self) -> Dict:
         """Load configuration from file"""
@@ -38,8 +183,7 @@ class Config:
                     "bikini", "bdsm", "rooftop", "pool", "gym"],
             "tag_usage": {},
             "source_folders": [],
-            "destination_folder": "",
-            "thumbnail_cache": {}
+            "destination_folder": ""
         }
 
         if os.path.exists(self.config_path):
@@ -53,15 +197,27 @@ class Config:
         return default_config
 
     def save(self):
-        """Save configuration to file"""
+        """Schedule a save, restarting the delay if one is already pending"""
+        self._save_timer.start()
+
+    def flush(self):
+        """Write configuration to file now"""
+        self._save_timer.stop()
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
+            # Write to a temporary file then swap it in, so a crash never leaves a truncated config
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.config_path)
         except Exception as e:
             print(f"Error saving config: {e}")
 
     def get_sorted_tags(self) -> List[str]:
         """Get tags sorted by usage (top 10) then alphabetically"""
+        # Every card asks for the same list: only re-sort after tags or usage change
+        if self._sorted_tags_cache is not None:
+            return self._sorted_tags_cache
+
         tags = self.data.get("tags", [])
         usage = self.data.get("tag_usage", {})
 
@@ -72,9 +228,10 @@ class Config:
         top_tags = sorted_by_usage[:10]
 
         # Remaining tags sorted alphabetically
-        remaining_tags = sorted([t for t in tags if t not in top_tags])
+        remaining_tags = sorted(set(tags) - set(top_tags))
 
-        return top_tags + remaining_tags
+        self._sorted_tags_cache = top_tags + remaining_tags
+        return self._sorted_tags_cache
 
     def increment_tag_usage(self, tag: str):
         """Increment usage count for a tag"""
@@ -82,6 +239,7 @@ class Config:
             self.data["tag_usage"] = {}
 
         self.data["tag_usage"][tag] = self.data["tag_usage"].get(tag, 0) + 1
+        self._sorted_tags_cache = None
         self.save()
 
     def add_tag(self, tag: str):
@@ -91,6 +249,7 @@ class Config:
 
         if tag not in self.data["tags"]:
             self.data["tags"].append(tag)
+            self._sorted_tags_cache = None
             self.save()
             return True
         return False
@@ -99,50 +258,116 @@ class Config:
 class ThumbnailWorkerSignals(QObject):
     """Signals for thumbnail worker"""
     finished = pyqtSignal(str, str)  # video_path, thumbnail_path
-    progress = pyqtSignal(int)  # progress count
+    progress = pyqtSignal(int, int)  # progress count, load generation
 
 
 class ThumbnailWorker(QRunnable):
     """Worker for generating thumbnails"""
 
-    def __init__(self, video_path: str, thumbnail_path: str):
+    def __init__(self, video_path: str, thumbnail_path: str, duplicate_paths: List[str] = None,
+                 generation: int = 0):
         super().__init__()
         self.video_path = video_path
         self.thumbnail_path = thumbnail_path
+        # Other paths to the same file: they get the result without re-decoding
+        self.duplicate_paths = duplicate_paths or []
+        # Which load_videos() call queued this job, so stale progress can be ignored
+        self.generation = generation
         self.signals = ThumbnailWorkerSignals()
 
+    def emit_finished(self, thumbnail_path: str):
+        """Report the result for the video and all its duplicate paths"""
+        for video_path in [self.video_path] + self.duplicate_paths:
+            self.signals.finished.emit(video_path, thumbnail_path)
+
+    def build_command(self, hwaccel_args: List[str], output_path: str) -> List[str]:
+        """Build the ffmpeg command extracting one thumbnail frame"""
+        # Extract the keyframe at or before 0.5 second. Seeking on the input
+        # side jumps straight to that keyframe, and skipping non-key frames
+        # avoids decoding any B/P frames at all. Decoded GPU frames are copied
+        # back to system memory, so the scale filter is the same in both paths.
+        return [
+            'ffmpeg',
+            *hwaccel_args,
+            '-ss', '00:00:00.5',
+            '-noaccurate_seek',
+            '-skip_frame', 'nokey',
+            '-i', self.video_path,
+            '-an', '-sn', '-dn',
+            '-vframes', '1',
+            '-vf', 'scale=320:180:force_original_aspect_ratio=decrease',
+            '-c:v', 'libwebp', '-q:v', '80',
+            '-y',
+            output_path
+        ]
+
+    def extract_with_pyav(self, output_path: str) -> bool:
+        """Decode one keyframe in-process with PyAV, return True on success"""
+        try:
+            with av.open(self.video_path) as container:
+                stream = container.streams.video[0]
+                # Same as ffmpeg's -skip_frame nokey: B/P frames are dropped by the decoder
+                stream.codec_context.skip_frame = 'NONKEY'
+                container.seek(int(0.5 * av.time_base))
+
+                for frame in container.decode(stream):
+                    img = frame.to_image()
+                    img.thumbnail((320, 180), Image.Resampling.LANCZOS)
+                    img.save(output_path, 'WEBP', quality=80)
+                    return True
+        except Exception as e:
+            print(f"  PyAV failed for {os.path.basename(self.video_path)}, falling back to ffmpeg: {e}")
+
+        return False
+
     @pyqtSlot()
     def run(self):
-        """Generate thumbnail using ffmpeg"""
+        """Generate thumbnail with PyAV if available, otherwise ffmpeg"""
         try:
             # Create thumbnail directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.thumbnail_path), exist_ok=True)
-
-            # Use ffmpeg to extract frame at 0.5 second (or first frame if video is too short)
-            cmd = [
-                'ffmpeg',
-                '-i', self.video_path,
-                '-ss', '00:00:00.5',
-                '-vframes', '1',
-                '-vf', 'scale=320:180:force_original_aspect_ratio=decrease',
-                '-y',
-                self.thumbnail_path
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0 and os.path.exists(self.thumbnail_path):
+            thumbnail_dir = os.path.dirname(self.thumbnail_path)
+            os.makedirs(thumbnail_dir, exist_ok=True)
+
+            # Write under a temporary name and only move it into place once complete,
+            # so a reload never picks up a half-written file and concurrent jobs
+            # for the same thumbnail can't interleave their writes
+            fd, tmp_path = tempfile.mkstemp(dir=thumbnail_dir, suffix=".tmp.webp")
+            os.close(fd)
+            try:
+                error = ""
+                if av is None or not self.extract_with_pyav(tmp_path):
+                    hwaccel_args = get_hwaccel_args()
+                    result = subprocess.run(
+                        self.build_command(hwaccel_args, tmp_path), capture_output=True, text=True
+                    )
+
+                    # Some codecs/profiles aren't supported by the GPU decoder: retry on CPU
+                    if result.returncode != 0 and hwaccel_args:
+                        result = subprocess.run(
+                            self.build_command([], tmp_path), capture_output=True, text=True
+                        )
+
+                    if result.returncode != 0:
+                        error = result.stderr
+
+                if not error and thumbnail_exists(tmp_path):
+                    os.replace(tmp_path, self.thumbnail_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+            if not error and thumbnail_exists(self.thumbnail_path):
                 print(f"✓ Thumbnail generated: {os.path.basename(self.video_path)}")
-                self.signals.finished.emit(self.video_path, self.thumbnail_path)
+                self.emit_finished(self.thumbnail_path)
             else:
                 print(f"✗ Failed to generate thumbnail for: {os.path.basename(self.video_path)}")
-                print(f"  Error: {result.stderr[:200]}")  # First 200 chars of error
-                self.signals.finished.emit(self.video_path, "")
+                print(f"  Error: {error[:200]}")  # First 200 chars of error
+                self.emit_finished("")
         except Exception as e:
             print(f"✗ Exception generating thumbnail for {os.path.basename(self.video_path)}: {e}")
-            self.signals.finished.emit(self.video_path, "")
+            self.emit_finished("")
         finally:
-            self.signals.progress.emit(1)
+            self.signals.progress.emit(1, self.generation)
 
 
 class VideoCard(QFrame):
@@ -153,6 +378,8 @@ class VideoCard(QFrame):
         self.video_path = video_path
         self.config = config
         self.selected_tags = set()
+        self.thumbnail_key = None
+        self.file_id = None
 
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.setLineWidth(2)
@@ -225,22 +452,31 @@ class VideoCard(QFrame):
 
         self.setLayout(layout)
 
-        # Generate thumbnail
-        self.generate_thumbnail()
-
     def generate_thumbnail(self):
         """Generate and display thumbnail"""
+        # The fingerprint changes when the file is replaced or re-encoded, so an
+        # entry for the same path with another fingerprint is stale
+        try:
+            st = os.stat(self.video_path)
+        except OSError as e:
+            print(f"✗ Cannot stat {self.video_path}: {e}")
+            self.thumbnail_label.setText("Erreur")
+            return True  # Nothing to generate
+
+        self.thumbnail_key = thumbnail_key(self.video_path, st)
+        # Identifies hardlinks/duplicate paths of the same file within this session
+        self.file_id = (st.st_dev, st.st_ino)
+
         # Check cache first
-        cache = self.config.data.get("thumbnail_cache", {})
-        cached_path = cache.get(self.video_path)
+        cached_path = self.config.thumbnail_cache.get(self.video_path, self.thumbnail_key)
 
         print(f"🔍 Checking cache for: {os.path.basename(self.video_path)}")
         print(f"    Cached path: {cached_path}")
-        print(f"    Path exists: {os.path.exists(cached_path) if cached_path else False}")
+        print(f"    Path exists: {thumbnail_exists(cached_path) if cached_path else False}")
 
-        if self.video_path in cache and os.path.exists(cache[self.video_path]):
+        if cached_path and thumbnail_exists(cached_path):
             print(f"  ✓ Using cached thumbnail for: {os.path.basename(self.video_path)}")
-            self.set_thumbnail(cache[self.video_path])
+            self.set_thumbnail(cached_path)
             return True  # Already cached
 
         print(f"  ⚠ Needs generation for: {os.path.basename(self.video_path)}")
@@ -253,13 +489,10 @@ class VideoCard(QFrame):
         print(f"    Paths match: {video_path == self.video_path}")
 
         if video_path == self.video_path:
-            if thumbnail_path and os.path.exists(thumbnail_path):
+            if thumbnail_path and thumbnail_exists(thumbnail_path):
                 print(f"  → Setting thumbnail from worker for: {os.path.basename(video_path)}")
                 # Update cache
-                if "thumbnail_cache" not in self.config.data:
-                    self.config.data["thumbnail_cache"] = {}
-                self.config.data["thumbnail_cache"][video_path] = thumbnail_path
-                self.config.save()
+                self.config.thumbnail_cache.set(video_path, self.thumbnail_key, thumbnail_path)
 
                 self.set_thumbnail(thumbnail_path)
             else:
@@ -271,20 +504,25 @@ class VideoCard(QFrame):
         print(f"  → Attempting to load thumbnail: {thumbnail_path}")
         print(f"    File exists: {os.path.exists(thumbnail_path)}")
 
-        pixmap = QPixmap(thumbnail_path)
-        print(f"    Pixmap loaded: {not pixmap.isNull()}, Size: {pixmap.width()}x{pixmap.height()}")
-
-        if not pixmap.isNull():
+        # Scaled pixmaps are kept in memory, so re-created cards skip the decode
+        scaled_pixmap = QPixmapCache.find(thumbnail_path)
+        if scaled_pixmap is None:
+            pixmap = QPixmap(thumbnail_path)
+            print(f"    Pixmap loaded: {not pixmap.isNull()}, Size: {pixmap.width()}x{pixmap.height()}")
+
+            if not pixmap.isNull():
+                scaled_pixmap = pixmap.scaled(
+                    320, 180,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                print(f"    Scaled to: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
+                QPixmapCache.insert(thumbnail_path, scaled_pixmap)
+
+        if scaled_pixmap is not None:
             # Clear any existing text first
             self.thumbnail_label.clear()
 
-            scaled_pixmap = pixmap.scaled(
-                320, 180,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            print(f"    Scaled to: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
-
             self.thumbnail_label.setPixmap(scaled_pixmap)
 
             # Force GUI update
@@ -312,21 +550,20 @@ class VideoCard(QFrame):
 
     def refresh_tags(self):
         """Refresh the tag list"""
-        # Clear existing checkboxes
-        for cb in self.tag_checkboxes.values():
-            self.tags_layout.removeWidget(cb)
-            cb.deleteLater()
-
-        self.tag_checkboxes.clear()
+        # Keep existing checkboxes: only create the missing ones and move
+        # those whose position changed in the sorted order
+        for idx, tag in enumerate(self.config.get_sorted_tags()):
+            cb = self.tag_checkboxes.get(tag)
+            if cb is None:
+                cb = QCheckBox(tag)
+                cb.stateChanged.connect(self.on_tag_changed)
+                self.tag_checkboxes[tag] = cb
+            elif self.tags_layout.indexOf(cb) == idx:
+                continue
+            else:
+                self.tags_layout.removeWidget(cb)
 
-        # Recreate checkboxes
-        for tag in self.config.get_sorted_tags():
-            cb = QCheckBox(tag)
-            cb.stateChanged.connect(self.on_tag_changed)
-            if tag in self.selected_tags:
-                cb.setChecked(True)
-            self.tag_checkboxes[tag] = cb
-            self.tags_layout.addWidget(cb)
+            self.tags_layout.insertWidget(idx, cb)
 
     def validate(self):
         """Validate and move video to organized location"""
@@ -362,7 +599,7 @@ class VideoCard(QFrame):
                     destination = os.path.join(tag_path, new_name)
                     counter += 1
 
-            shutil.move(self.video_path, destination)
+            fast_move(self.video_path, destination)
 
             # Update tag usage statistics
             for tag in self.selected_tags:
@@ -434,14 +671,18 @@ class AddTagDialog(QDialog):
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    CARDS_PER_BATCH = 30  # Enough rows to overflow the viewport, multiple of the 3 columns
+
     def __init__(self):
         super().__init__()
         self.config = Config()
         self.video_cards = []
+        self.pending_videos = []
         self.thumbnail_pool = QThreadPool()
-        self.thumbnail_pool.setMaxThreadCount(5)  # Limit to 5 concurrent thumbnail generations
+        self.thumbnail_pool.setMaxThreadCount(os.cpu_count() or 1)  # One ffmpeg process per core
         self.thumbnails_generated = 0
         self.total_thumbnails = 0
+        self.load_generation = 0
 
         self.setWindowTitle("Video Organizer")
         self.setMinimumSize(1200, 800)
@@ -503,17 +744,22 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.progress_widget)
 
         # Scroll area for video grid
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Scrolling down, or the grid shrinking as cards are validated, may bring
+        # the bottom into view: both are checked for more videos to show
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.check_load_more)
+        scroll_bar.rangeChanged.connect(self.check_load_more)
 
         self.scroll_widget = QWidget()
         self.grid_layout = QGridLayout(self.scroll_widget)
         self.grid_layout.setSpacing(10)
         self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
 
-        scroll_area.setWidget(self.scroll_widget)
-        main_layout.addWidget(scroll_area)
+        self.scroll_area.setWidget(self.scroll_widget)
+        main_layout.addWidget(self.scroll_area)
 
     def update_folders_label(self):
         """Update the folders display label"""
@@ -557,11 +803,18 @@ class MainWindow(QMainWindow):
 
     def load_videos(self):
         """Load videos from source folders"""
+        # Drop queued thumbnail jobs for the cards about to be removed, so the
+        # pool only works for the new ones (jobs already running just finish)
+        self.thumbnail_pool.clear()
+        self.load_generation += 1
+        self.progress_widget.setVisible(False)
+
         # Clear existing cards
         for card in self.video_cards:
             card.setParent(None)
             card.deleteLater()
         self.video_cards.clear()
+        self.pending_videos = []
 
         # Get all videos
         video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v'}
@@ -572,12 +825,7 @@ class MainWindow(QMainWindow):
             if not os.path.exists(folder):
                 continue
 
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in video_extensions):
-                        video_path = os.path.join(root, file)
-                        mtime = os.path.getmtime(video_path)
-                        videos.append((video_path, mtime))
+            videos.extend(scan_videos(folder, video_extensions))
 
         # Sort by modification time (newest first)
         videos.sort(key=lambda x: x[1], reverse=True)
@@ -589,11 +837,34 @@ class MainWindow(QMainWindow):
             self.grid_layout.addWidget(label, 0, 0, 1, 3)
             return
 
+        self.pending_videos = [video_path for video_path, _ in videos]
+        self.total_thumbnails = 0
+        self.thumbnails_generated = 0
+        print(f"\n📊 Total videos: {len(videos)}")
+
+        self.load_more_videos()
+
+    def check_load_more(self, *args):
+        """Create the next batch of cards when less than a page remains below the viewport"""
+        # One batch at a time: the grid is laid out again afterwards, and the
+        # resulting rangeChanged calls back here until the viewport is filled
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if self.pending_videos and scroll_bar.maximum() - scroll_bar.value() < scroll_bar.pageStep():
+            self.load_more_videos()
+
+    def load_more_videos(self):
+        """Create cards for the next batch of videos and queue their thumbnails"""
+        # Cards are only created as the user scrolls, so a large library doesn't
+        # allocate thousands of widgets (and thumbnails) up front
+        batch = self.pending_videos[:self.CARDS_PER_BATCH]
+        self.pending_videos = self.pending_videos[self.CARDS_PER_BATCH:]
+
         # Create video cards in grid
         columns = 3
         thumbnails_to_generate = []
 
-        for idx, (video_path, _) in enumerate(videos):
+        for video_path in batch:
+            idx = len(self.video_cards)
             row = idx // columns
             col = idx % columns
 
@@ -605,36 +876,61 @@ class MainWindow(QMainWindow):
             if not card.generate_thumbnail():
                 thumbnails_to_generate.append((card, video_path))
 
+        # A batch too small to make the grid scrollable leaves the range at 0,
+        # so rangeChanged won't fire: check again once the grid is laid out
+        QTimer.singleShot(0, self.check_load_more)
+
+        # Paths to the same underlying file (hardlinks, duplicate folders) are
+        # grouped so each file is only generated once; a thumbnail may also
+        # already exist on disk under one of their keys
+        thumbnail_dir = os.path.expanduser("~/.cache/video_organizer/thumbnails")
+        os.makedirs(thumbnail_dir, exist_ok=True)
+
+        groups = {}
+        for card, video_path in thumbnails_to_generate:
+            groups.setdefault(card.file_id, []).append((card, video_path))
+
+        pending = {}
+        for cards in groups.values():
+            candidates = [os.path.join(thumbnail_dir, f"{card.thumbnail_key}.webp") for card, _ in cards]
+            existing = next((path for path in candidates if thumbnail_exists(path)), None)
+            if existing:
+                for card, video_path in cards:
+                    card.on_thumbnail_ready(video_path, existing)
+            else:
+                pending[candidates[0]] = cards
+
         # Generate thumbnails with thread pool
-        if thumbnails_to_generate:
-            self.total_thumbnails = len(thumbnails_to_generate)
-            self.thumbnails_generated = 0
+        if pending:
+            self.total_thumbnails += len(pending)
             self.progress_widget.setVisible(True)
             self.update_progress()
 
-            print(f"\n📊 Total videos: {len(videos)}")
-            print(f"📊 Cached thumbnails: {len(videos) - len(thumbnails_to_generate)}")
-            print(f"📊 Thumbnails to generate: {self.total_thumbnails}")
+            print(f"📊 Cards created: {len(self.video_cards)}")
+            print(f"📊 Cached thumbnails: {len(batch) - len(thumbnails_to_generate)}")
+            print(f"📊 Thumbnails to generate: {len(pending)}")
             print(f"📊 Starting thumbnail generation...\n")
 
-            thumbnail_dir = os.path.expanduser("~/.cache/video_organizer/thumbnails")
-            os.makedirs(thumbnail_dir, exist_ok=True)
-
-            for card, video_path in thumbnails_to_generate:
-                video_hash = str(hash(video_path))
-                thumbnail_path = os.path.join(thumbnail_dir, f"{video_hash}.jpg")
-
-                worker = ThumbnailWorker(video_path, thumbnail_path)
+            for thumbnail_path, cards in pending.items():
+                video_paths = [video_path for _, video_path in cards]
+                worker = ThumbnailWorker(
+                    video_paths[0], thumbnail_path, video_paths[1:], self.load_generation
+                )
                 # Use QueuedConnection to ensure GUI updates happen on main thread
-                worker.signals.finished.connect(card.on_thumbnail_ready, Qt.ConnectionType.QueuedConnection)
+                for card, _ in cards:
+                    worker.signals.finished.connect(card.on_thumbnail_ready, Qt.ConnectionType.QueuedConnection)
                 worker.signals.progress.connect(self.on_thumbnail_progress, Qt.ConnectionType.QueuedConnection)
 
                 self.thumbnail_pool.start(worker)
         else:
-            print(f"\n✓ All {len(videos)} thumbnails are cached!\n")
+            print(f"✓ All {len(batch)} thumbnails of this batch are cached!\n")
 
-    def on_thumbnail_progress(self, count):
+    def on_thumbnail_progress(self, count, generation):
         """Update progress when a thumbnail is generated"""
+        # Jobs still running from before the last reload don't count towards the new total
+        if generation != self.load_generation:
+            return
+
         self.thumbnails_generated += count
         self.update_progress()
 
@@ -642,6 +938,11 @@ class MainWindow(QMainWindow):
             # All thumbnails generated
             self.progress_widget.setVisible(False)
 
+    def closeEvent(self, event):
+        """Write pending configuration changes before closing"""
+        self.config.flush()
+        super().closeEvent(event)
+
     def update_progress(self):
         """Update progress bar and label"""
         self.progress_label.setText(f"Miniatures: {self.thumbnails_generated}/{self.total_thumbnails}")
@@ -657,6 +958,9 @@ def main():
     # Set dark theme
     app.setStyle("Fusion")
 
+    # Room for the scaled thumbnails of a large library (limit is in KiB)
+    QPixmapCache.setCacheLimit(200 * 1024)
+
     window = MainWindow()
     window.show()
 